@@ -1,20 +1,250 @@
 import os
+import sys
+import re
 import yaml
 import json
+import mmap
 import struct
 import base64
+import shutil
+import numpy as np
+import hashlib
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 from godot_parser import GDScene, Node, Property, ExtResource
 
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+
+def _intern_identifier(value):
+    # Scenes and prefabs repeat the same short identifiers ('Type', 'Name',
+    # 'MeshRenderer', ...) thousands of times; interning them shares one
+    # string object per value and speeds up the dict lookups that follow.
+    if len(value) < 64 and value.isascii() and value.isidentifier():
+        return sys.intern(value)
+    return value
+
+
+class _InterningLoader(_YLoader):
+    def construct_yaml_str(self, node):
+        return _intern_identifier(self.construct_scalar(node))
+
+
+_InterningLoader.add_constructor('tag:yaml.org,2002:str', _InterningLoader.construct_yaml_str)
+
+
+def _yload(stream):
+    return yaml.load(stream, Loader=_InterningLoader)
+
+
+def _iter_files(root):
+    # Iterative scandir walk; DirEntry caches its type so no extra stat calls.
+    pending = deque([root])
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _load_yaml_sidecar(sidecar_path):
+    with open(sidecar_path, 'rb') as f:
+        return json.load(f)
+
+
+_MMAP_THRESHOLD = 1 << 20
+
+# Texture formats Unity accepts but Godot cannot import are re-encoded to PNG
+# through PIL; everything else is copied unchanged.
+_TEXTURE_TARGET_EXT = {
+    ".psd": ".png",
+    ".tif": ".png",
+    ".tiff": ".png",
+    ".gif": ".png",
+}
+
+_COLOR_FMT = "Color({r}, {g}, {b}, {a})"
+_VECTOR2_FMT = "Vector2({x}, {y})"
+_VECTOR3_FMT = "Vector3({x}, {y}, {z})"
+_TRANSFORM_FMT = "Transform(Vector3({}, {}, {}), Quat({}, {}, {}, {}), Vector3({}, {}, {}))"
+
+
+def _load_yaml_cached(path, cache_dir):
+    # Parsed YAML is stored as JSON keyed by a hash of the file contents, so
+    # unchanged (or duplicated/renamed) assets skip the YAML parser entirely.
+    # Large files (big .unity scenes) are mapped rather than read so hashing
+    # and parsing work from the page cache without a second in-memory copy.
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+    try:
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        sidecar_path = os.path.join(cache_dir, f"{digest}.json")
+        if os.path.exists(sidecar_path):
+            return _load_yaml_sidecar(sidecar_path)
+        parsed = _yload(data)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+    _write_yaml_sidecar(sidecar_path, parsed)
+    return parsed
+
+
+def _write_yaml_sidecar(sidecar_path, parsed):
+    # Only cache data that survives a JSON round trip unchanged; dates,
+    # non-string keys and the like are simply re-parsed on every run.
+    try:
+        text = json.dumps(parsed)
+    except (TypeError, ValueError):
+        return
+    if json.loads(text) != parsed:
+        return
+    os.makedirs(os.path.dirname(sidecar_path), exist_ok=True)
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, sidecar_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_by_stat(path, cache_dir, st_ino, st_mtime_ns, st_size):
+    return _load_yaml_cached(path, cache_dir)
+
+
+def _load_yaml(path, cache_dir):
+    # Small in-run cache keyed by cheap stat data so a repeated load of an
+    # unchanged file skips reading and hashing it (no current caller reloads
+    # a file; references resolve through asset_map). Files large enough to be
+    # memory-mapped bypass it so big scenes are not pinned in memory; the
+    # content-hashed sidecars behind it carry results across runs.
+    st = os.stat(path)
+    if st.st_size > _MMAP_THRESHOLD:
+        return _load_yaml_cached(path, cache_dir)
+    return _load_yaml_by_stat(path, cache_dir, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _write_bytes(path, data):
+    # Outputs are assembled in memory first, so skip Python's buffering layer
+    # and hand the whole payload to write() directly.
+    with open(path, 'wb', buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view):]
+
+
+def _transform_row(unity_transform):
+    # Flattens a Unity transform into the (scale, rotation, position) order
+    # _TRANSFORM_FMT expects.
+    return (
+        *unity_transform.get('scale', (1, 1, 1)),
+        *unity_transform.get('rotation', (0, 0, 0, 1)),
+        *unity_transform.get('position', (0, 0, 0)),
+    )
+
+
+def _format_transform_keys(times, transforms):
+    # Formats a whole track's keys in one tight loop, kept separate from the
+    # numeric unpacking so the key data can arrive in any row-sequence form.
+    transform_fmt = _TRANSFORM_FMT.format
+    return [(str(t), transform_fmt(*row)) for t, row in zip(times, transforms)]
+
+
+def _property_text(type_name, value):
+    if type_name == "String":
+        return json.dumps(value)
+    if type_name == "NodePath":
+        return f"NodePath({json.dumps(value)})"
+    return value
+
+
+class _SceneNode:
+    __slots__ = ("type", "name", "properties", "children")
+
+    def __init__(self, node_type, name=None):
+        self.type = node_type
+        self.name = name
+        self.properties = []
+        self.children = []
+
+    def add_property(self, key, value):
+        self.properties.append(f"{key} = {value}")
+
+    def add_child(self, node):
+        self.children.append(node)
+
+
+class _SceneWriter:
+    # Emits .tscn text straight into a byte buffer instead of building a
+    # godot_parser GDScene and letting it serialize its own object graph.
+    def __init__(self):
+        self.root = None
+
+    def node(self, node_type, name=None, parent=None):
+        node = _SceneNode(node_type, name)
+        if parent is None:
+            self.root = node
+        else:
+            parent.add_child(node)
+        return node
+
+    def render(self):
+        buf = bytearray(b"[gd_scene load_steps=1 format=2]\n")
+        # Depth-first, children in insertion order; each entry carries the
+        # node's parent path ("." for children of the root).
+        stack = [(self.root, None)]
+        while stack:
+            node, parent_path = stack.pop()
+            name = node.name or node.type
+            if parent_path is None:
+                header = f"\n[node name={json.dumps(name)} type={json.dumps(node.type)}]\n"
+                path = "."
+            else:
+                header = f"\n[node name={json.dumps(name)} type={json.dumps(node.type)} parent={json.dumps(parent_path)}]\n"
+                path = name if parent_path == "." else f"{parent_path}/{name}"
+            buf += header.encode()
+            if node.properties:
+                buf += ("\n".join(node.properties) + "\n").encode()
+            stack.extend((child, path) for child in reversed(node.children))
+        return buf
+
+    def write(self, path):
+        _write_bytes(path, self.render())
+
+
 class UnityToGodotConverter:
-    def __init__(self, unity_project_path, godot_project_path):
+    def __init__(self, unity_project_path, godot_project_path, use_gdscene=False):
         self.unity_project_path = unity_project_path
         self.godot_project_path = godot_project_path
+        # use_gdscene keeps the original godot_parser serialization path
+        # available for comparing output against the direct writer.
+        self.use_gdscene = use_gdscene
+        self._property = Property if use_gdscene else _property_text
+        self._P = {type_name: functools.partial(self._property, type_name) for type_name in ("float", "Color", "ExtResource")}
+        self._extres_cache = {}
+        self.yaml_cache_dir = os.path.join(godot_project_path, ".cache", "yaml")
         self.prefabs = {}
         self.materials = {}
         self.meshes = {}
         self.animations = {}
         self.scripts = {}
+        self.scenes = {}
         self.asset_map = {}
         self.unity_types_to_godot = {
             "Transform": "Node3D",
@@ -32,8 +262,27 @@ class UnityToGodotConverter:
             "Button": "Button",
             "ParticleSystem": "GPUParticles3D",
         }
+        self._known_unity_types = frozenset(self.unity_types_to_godot)
+        self._component_dispatch = {
+            "MeshFilter": self.convert_mesh_filter,
+            "MeshRenderer": self.convert_mesh_renderer,
+            "Camera": self.convert_camera,
+            "Light": self.convert_light,
+            "Rigidbody": self.convert_rigidbody,
+            "BoxCollider": self.convert_collider,
+            "SphereCollider": self.convert_collider,
+            "CapsuleCollider": self.convert_collider,
+            "ParticleSystem": self.convert_particle_system,
+            "Canvas": self.convert_canvas,
+            "RectTransform": self.convert_rect_transform,
+            "MonoBehaviour": self.convert_script_component,
+        }
 
     def convert_project(self):
+        # Output subdirectories are fixed, so create them once up front rather
+        # than once per converted asset.
+        for subdir in ("materials", "meshes", "animations", "scripts", "textures", "prefabs"):
+            os.makedirs(os.path.join(self.godot_project_path, subdir), exist_ok=True)
         self.analyze_project_structure()
         self.convert_assets()
         self.convert_scenes()
@@ -41,18 +290,20 @@ class UnityToGodotConverter:
         self.update_asset_references()
 
     def analyze_project_structure(self):
-        for root, _, files in os.walk(self.unity_project_path):
-            for file in files:
-                if file.endswith(".prefab"):
-                    self.analyze_prefab(os.path.join(root, file))
-                elif file.endswith(".mat"):
-                    self.analyze_material(os.path.join(root, file))
-                elif file.endswith(".fbx") or file.endswith(".obj"):
-                    self.analyze_mesh(os.path.join(root, file))
-                elif file.endswith(".anim"):
-                    self.analyze_animation(os.path.join(root, file))
-                elif file.endswith(".cs"):
-                    self.analyze_script(os.path.join(root, file))
+        analyzers = {
+            "prefab": self.analyze_prefab,
+            "mat": self.analyze_material,
+            "fbx": self.analyze_mesh,
+            "obj": self.analyze_mesh,
+            "anim": self.analyze_animation,
+            "cs": self.analyze_script,
+            "unity": self.analyze_scene,
+        }
+        for entry in _iter_files(self.unity_project_path):
+            _, dot, ext = entry.name.rpartition('.')
+            analyzer = analyzers.get(ext.lower()) if dot else None
+            if analyzer:
+                analyzer(entry.path)
 
     def analyze_prefab(self, prefab_path):
         prefab_name = os.path.splitext(os.path.basename(prefab_path))[0]
@@ -74,39 +325,77 @@ class UnityToGodotConverter:
         script_name = os.path.splitext(os.path.basename(script_path))[0]
         self.scripts[script_name] = script_path
 
+    def analyze_scene(self, scene_path):
+        # Scenes keep their Assets-relative path so the Godot output mirrors
+        # the Unity folder layout.
+        scene_name = os.path.splitext(os.path.relpath(scene_path, self.unity_project_path))[0]
+        if scene_name.startswith("Assets" + os.sep):
+            self.scenes[scene_name] = scene_path
+
     def convert_assets(self):
-        self.convert_materials()
-        self.convert_meshes()
-        self.convert_animations()
-        self.convert_scripts()
-
-    def convert_materials(self):
-        for material_name, material_path in self.materials.items():
-            godot_material_path = os.path.join(self.godot_project_path, "materials", f"{material_name}.tres")
-            os.makedirs(os.path.dirname(godot_material_path), exist_ok=True)
-            
-            with open(material_path, 'r') as f:
-                material_data = yaml.safe_load(f)
-            
-            material = GDScene()
-            material.add_node(Node("SpatialMaterial", name="material"))
-            
-            self.convert_material_properties(material_data, material.nodes[-1])
-            
-            material.write(godot_material_path)
-            
-            self.asset_map[material_path] = godot_material_path
+        if not (self.materials or self.meshes or self.animations or self.scripts):
+            return
+        with self._process_pool() as executor:
+            self.convert_materials(executor)
+            self.convert_meshes(executor)
+            self.convert_animations(executor)
+            self.convert_scripts(executor)
+
+    def _process_pool(self):
+        # max_workers=None lets the executor pick the CPU count and apply its
+        # own platform limits (e.g. at most 61 workers on Windows).
+        return ProcessPoolExecutor(
+            max_workers=None,
+            initializer=_init_worker,
+            initargs=(self.unity_project_path, self.godot_project_path, self.use_gdscene, self.asset_map),
+        )
+
+    def _map_tasks(self, method, tasks, executor=None):
+        # Per-file conversions are independent, so they are fanned out to
+        # worker processes; results are merged back on the main process.
+        if executor is None:
+            return [method(*args) for args in tasks]
+        return list(executor.map(_run_worker_task, itertools.repeat(method.__name__), tasks, chunksize=16))
+
+    def _new_scene(self, root_type, root_name):
+        if self.use_gdscene:
+            scene = GDScene()
+            root_node = Node(root_type, name=root_name)
+            scene.add_node(root_node)
+            return scene, root_node
+        scene = _SceneWriter()
+        return scene, scene.node(root_type, root_name)
+
+    def _new_node(self, node_type, name=None):
+        if self.use_gdscene:
+            return Node(node_type, name=name)
+        return _SceneNode(node_type, name)
+
+    def convert_materials(self, executor=None):
+        self.asset_map.update(self._map_tasks(self.convert_material, self.materials.items(), executor))
+
+    def convert_material(self, material_name, material_path):
+        godot_material_path = os.path.join(self.godot_project_path, "materials", f"{material_name}.tres")
+        material_data = _load_yaml(material_path, self.yaml_cache_dir)
+        
+        material, material_node = self._new_scene("SpatialMaterial", "material")
+        
+        self.convert_material_properties(material_data, material_node)
+        
+        material.write(godot_material_path)
+        
+        return material_path, godot_material_path
 
     def convert_material_properties(self, unity_material, godot_material):
         if 'Color' in unity_material:
             color = unity_material['Color']
-            godot_material.add_property("albedo_color", Property("Color", f"Color({color['r']}, {color['g']}, {color['b']}, {color['a']})"))
+            godot_material.add_property("albedo_color", self._P['Color'](_COLOR_FMT.format_map(color)))
         
         if 'Metallic' in unity_material:
-            godot_material.add_property("metallic", Property("float", str(unity_material['Metallic'])))
+            godot_material.add_property("metallic", self._P['float'](str(unity_material['Metallic'])))
         
         if 'Smoothness' in unity_material:
-            godot_material.add_property("roughness", Property("float", str(1 - unity_material['Smoothness'])))
+            godot_material.add_property("roughness", self._P['float'](str(1 - unity_material['Smoothness'])))
         
         self.convert_texture_map(unity_material, godot_material, 'MainTex', 'albedo_texture')
         self.convert_texture_map(unity_material, godot_material, 'BumpMap', 'normal_texture')
@@ -116,25 +405,31 @@ class UnityToGodotConverter:
         if unity_prop in unity_material:
             texture_path = unity_material[unity_prop]['Texture']
             godot_texture_path = self.convert_texture(texture_path)
-            godot_material.add_property(godot_prop, Property("ExtResource", f'ExtResource("{godot_texture_path}")'))
+            godot_material.add_property(godot_prop, self._P['ExtResource'](f'ExtResource("{godot_texture_path}")'))
 
     def convert_texture(self, unity_texture_path):
-        godot_texture_path = os.path.join(self.godot_project_path, "textures", os.path.basename(unity_texture_path))
-        os.makedirs(os.path.dirname(godot_texture_path), exist_ok=True)
+        texture_name, texture_ext = os.path.splitext(os.path.basename(unity_texture_path))
+        target_ext = _TEXTURE_TARGET_EXT.get(texture_ext.lower(), texture_ext)
+        godot_texture_path = os.path.join(self.godot_project_path, "textures", texture_name + target_ext)
+        # Godot imports the source format as-is: copy the bytes instead of
+        # decoding and re-encoding.
+        if target_ext == texture_ext:
+            shutil.copyfile(unity_texture_path, godot_texture_path)
+            return godot_texture_path
         
         with Image.open(unity_texture_path) as img:
-            img.save(godot_texture_path)
+            img.save(godot_texture_path, optimize=False)
         
         return godot_texture_path
 
-    def convert_meshes(self):
-        for mesh_name, mesh_path in self.meshes.items():
-            godot_mesh_path = os.path.join(self.godot_project_path, "meshes", f"{mesh_name}.mesh")
-            os.makedirs(os.path.dirname(godot_mesh_path), exist_ok=True)
-            
-            self.placeholder_mesh_conversion(mesh_path, godot_mesh_path)
-            
-            self.asset_map[mesh_path] = godot_mesh_path
+    def convert_meshes(self, executor=None):
+        self.asset_map.update(self._map_tasks(self.convert_mesh, self.meshes.items(), executor))
+
+    def convert_mesh(self, mesh_name, mesh_path):
+        godot_mesh_path = os.path.join(self.godot_project_path, "meshes", f"{mesh_name}.mesh")
+        self.placeholder_mesh_conversion(mesh_path, godot_mesh_path)
+        
+        return mesh_path, godot_mesh_path
 
     def placeholder_mesh_conversion(self, unity_mesh_path, godot_mesh_path):
         print(f"Converting mesh: {unity_mesh_path} to {godot_mesh_path}")
@@ -150,167 +445,167 @@ class UnityToGodotConverter:
             3, 2, 6, 6, 7, 3,  # Top
             4, 5, 1, 1, 0, 4   # Bottom
         ]
-        with open(godot_mesh_path, 'wb') as f:
-            f.write(struct.pack('<I', len(vertices)))
-            for v in vertices:
-                f.write(struct.pack('<fff', *v))
-            f.write(struct.pack('<I', len(indices)))
-            for i in indices:
-                f.write(struct.pack('<I', i))
-
-    def convert_animations(self):
-        for anim_name, anim_path in self.animations.items():
-            godot_anim_path = os.path.join(self.godot_project_path, "animations", f"{anim_name}.anim")
-            os.makedirs(os.path.dirname(godot_anim_path), exist_ok=True)
-            
-            with open(anim_path, 'r') as f:
-                anim_data = yaml.safe_load(f)
-            
-            animation = GDScene()
-            animation.add_node(Node("Animation", name="animation"))
-            
-            self.convert_animation_data(anim_data, animation.nodes[-1])
-            
-            animation.write(godot_anim_path)
-            
-            self.asset_map[anim_path] = godot_anim_path
+        vertex_data = np.asarray(vertices, dtype='<f4')
+        index_data = np.asarray(indices, dtype='<u4')
+        _write_bytes(godot_mesh_path, b"".join((
+            struct.pack('<I', vertex_data.shape[0]),
+            vertex_data.tobytes(),
+            struct.pack('<I', index_data.shape[0]),
+            index_data.tobytes(),
+        )))
+
+    def convert_animations(self, executor=None):
+        self.asset_map.update(self._map_tasks(self.convert_animation, self.animations.items(), executor))
+
+    def convert_animation(self, anim_name, anim_path):
+        godot_anim_path = os.path.join(self.godot_project_path, "animations", f"{anim_name}.anim")
+        anim_data = _load_yaml(anim_path, self.yaml_cache_dir)
+        
+        animation, animation_node = self._new_scene("Animation", "animation")
+        
+        self.convert_animation_data(anim_data, animation_node)
+        
+        animation.write(godot_anim_path)
+        
+        return anim_path, godot_anim_path
 
     def convert_animation_data(self, unity_anim, godot_anim):
-        godot_anim.add_property("length", Property("float", str(unity_anim.get('length', 1.0))))
-        godot_anim.add_property("loop", Property("bool", str(unity_anim.get('loop', False)).lower()))
+        godot_anim.add_property("length", self._P['float'](str(unity_anim.get('length', 1.0))))
+        godot_anim.add_property("loop", self._property("bool", str(unity_anim.get('loop', False)).lower()))
         
         for track in unity_anim.get('tracks', []):
             self.convert_animation_track(track, godot_anim)
 
     def convert_animation_track(self, unity_track, godot_anim):
-        track_node = Node("Track", name=unity_track['path'])
+        track_node = self._new_node("Track", unity_track['path'])
         godot_anim.add_child(track_node)
         
-        track_node.add_property("type", Property("String", "transform"))
-        track_node.add_property("path", Property("NodePath", unity_track['path']))
+        track_node.add_property("type", self._property("String", "transform"))
+        track_node.add_property("path", self._property("NodePath", unity_track['path']))
         
-        keys_node = Node("Keys")
+        keys_node = self._new_node("Keys")
         track_node.add_child(keys_node)
         
-        for i, key in enumerate(unity_track['keys']):
-            key_node = Node(f"Key{i}")
+        keys = unity_track['keys']
+        times = [key['time'] for key in keys]
+        transforms = [_transform_row(key['value']) for key in keys]
+        
+        for i, (time_text, transform_text) in enumerate(_format_transform_keys(times, transforms)):
+            key_node = self._new_node(f"Key{i}")
             keys_node.add_child(key_node)
-            key_node.add_property("time", Property("float", str(key['time'])))
-            key_node.add_property("transform", Property("Transform", self.convert_transform(key['value'])))
+            key_node.add_property("time", self._P['float'](time_text))
+            key_node.add_property("transform", self._property("Transform", transform_text))
 
     def convert_transform(self, unity_transform):
-        position = unity_transform.get('position', [0, 0, 0])
-        rotation = unity_transform.get('rotation', [0, 0, 0, 1])
-        scale = unity_transform.get('scale', [1, 1, 1])
-        return f"Transform(Vector3({scale[0]}, {scale[1]}, {scale[2]}), Quat({rotation[0]}, {rotation[1]}, {rotation[2]}, {rotation[3]}), Vector3({position[0]}, {position[1]}, {position[2]}))"
-
-    def convert_scripts(self):
-        for script_name, script_path in self.scripts.items():
-            godot_script_path = os.path.join(self.godot_project_path, "scripts", f"{script_name}.gd")
-            os.makedirs(os.path.dirname(godot_script_path), exist_ok=True)
-            
-            self.convert_csharp_to_gdscript(script_path, godot_script_path)
-            
-            self.asset_map[script_path] = godot_script_path
+        return _TRANSFORM_FMT.format(*_transform_row(unity_transform))
+
+    def convert_scripts(self, executor=None):
+        self.asset_map.update(self._map_tasks(self.convert_script, self.scripts.items(), executor))
+
+    def convert_script(self, script_name, script_path):
+        godot_script_path = os.path.join(self.godot_project_path, "scripts", f"{script_name}.gd")
+        self.convert_csharp_to_gdscript(script_path, godot_script_path)
+        
+        return script_path, godot_script_path
 
     def convert_csharp_to_gdscript(self, csharp_path, gdscript_path):
         print(f"Converting script: {csharp_path} to {gdscript_path}")
-        with open(csharp_path, 'r') as csharp_file, open(gdscript_path, 'w') as gdscript_file:
+        header = f"# Converted from {os.path.basename(csharp_path)}\n\nextends Node\n\n# TODO: Convert C# code to GDScript\n\n# Original C# code:\n'''\n"
+        with open(csharp_path, 'rb') as csharp_file:
             csharp_content = csharp_file.read()
-            gdscript_content = f"# Converted from {os.path.basename(csharp_path)}\n\nextends Node\n\n# TODO: Convert C# code to GDScript\n\n# Original C# code:\n'''\n{csharp_content}\n'''"
-            gdscript_file.write(gdscript_content)
+        _write_bytes(gdscript_path, b"".join((header.encode(), csharp_content, b"\n'''")))
 
     def convert_scenes(self):
-        for root, _, files in os.walk(os.path.join(self.unity_project_path, "Assets")):
-            for file in files:
-                if file.endswith(".unity"):
-                    unity_scene_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(unity_scene_path, self.unity_project_path)
-                    godot_scene_path = os.path.join(self.godot_project_path, "scenes", relative_path.replace(".unity", ".tscn"))
-                    os.makedirs(os.path.dirname(godot_scene_path), exist_ok=True)
-                    
-                    self.convert_scene(unity_scene_path, godot_scene_path)
+        scene_tasks = [
+            (unity_scene_path, os.path.join(self.godot_project_path, "scenes", f"{scene_name}.tscn"))
+            for scene_name, unity_scene_path in self.scenes.items()
+        ]
+        
+        for scene_dir in {os.path.dirname(godot_scene_path) for _, godot_scene_path in scene_tasks}:
+            os.makedirs(scene_dir, exist_ok=True)
+        
+        if not scene_tasks:
+            return
+        with self._process_pool() as executor:
+            self.asset_map.update(self._map_tasks(self.convert_scene, scene_tasks, executor))
 
     def convert_scene(self, unity_scene_path, godot_scene_path):
-        with open(unity_scene_path, 'r') as f:
-            unity_scene = yaml.safe_load(f)
+        unity_scene = _load_yaml(unity_scene_path, self.yaml_cache_dir)
         
-        godot_scene = GDScene()
-        root_node = Node("Node3D", name="Scene")
-        godot_scene.add_node(root_node)
+        godot_scene, root_node = self._new_scene("Node3D", "Scene")
         
         for game_object in unity_scene.get('GameObjects', []):
             self.convert_game_object(game_object, root_node)
         
         godot_scene.write(godot_scene_path)
+        
+        return unity_scene_path, godot_scene_path
 
     def convert_game_object(self, game_object, parent_node):
-        node_type = self.determine_node_type(game_object)
-        node_name = game_object.get('Name', 'GameObject')
-        node = Node(node_type, name=node_name)
-        
-        self.convert_transform(game_object, node)
-        
-        for component in game_object.get('Components', []):
-            self.convert_component(component, node)
-        
-        parent_node.add_child(node)
-        
-        for child in game_object.get('Children', []):
-            self.convert_game_object(child, node)
+        # Explicit stack instead of recursion so deep hierarchies don't hit
+        # the interpreter's recursion limit; children are pushed in reverse
+        # so they are still visited (and attached) in their original order.
+        stack = deque([(game_object, parent_node)])
+        while stack:
+            game_object, parent_node = stack.pop()
+            node_type = self.determine_node_type(game_object)
+            node_name = game_object.get('Name', 'GameObject')
+            node = self._new_node(node_type, node_name)
+            
+            node.add_property("transform", self._property("Transform", self.convert_transform(game_object)))
+            
+            for component in game_object.get('Components', []):
+                self.convert_component(component, node)
+            
+            parent_node.add_child(node)
+            
+            stack.extend((child, node) for child in reversed(game_object.get('Children', [])))
 
     def determine_node_type(self, game_object):
-        for component in game_object.get('Components', []):
-            component_type = component.get('Type')
-            if component_type in self.unity_types_to_godot:
-                return self.unity_types_to_godot[component_type]
-        return "Node3D"
+        known_types = self._known_unity_types
+        return next(
+            (self.unity_types_to_godot[c['Type']] for c in game_object.get('Components', []) if c.get('Type') in known_types),
+            "Node3D",
+        )
 
     def convert_component(self, component, node):
         component_type = component.get('Type')
-        if component_type == "MeshFilter":
-            self.convert_mesh_filter(component, node)
-        elif component_type == "MeshRenderer":
-            self.convert_mesh_renderer(component, node)
-        elif component_type == "Camera":
-            self.convert_camera(component, node)
-        elif component_type == "Light":
-            self.convert_light(component, node)
-        elif component_type == "Rigidbody":
-            self.convert_rigidbody(component, node)
-        elif component_type in ["BoxCollider", "SphereCollider", "CapsuleCollider"]:
-            self.convert_collider(component, node)
-        elif component_type == "ParticleSystem":
-            self.convert_particle_system(component, node)
-        elif component_type == "Canvas":
-            self.convert_canvas(component, node)
-        elif component_type == "RectTransform":
-            self.convert_rect_transform(component, node)
-        elif component_type == "MonoBehaviour":
-            self.convert_script_component(component, node)
+        converter = self._component_dispatch.get(component_type)
+        if converter:
+            converter(component, node)
         else:
             print(f"Unhandled component type: {component_type}")
 
+    def _ext_resource(self, unity_path):
+        # Assets are referenced from many nodes, so each reference string is
+        # built once per asset and reused.
+        ref = self._extres_cache.get(unity_path)
+        if ref is None:
+            godot_path = self.asset_map.get(unity_path)
+            if godot_path:
+                ref = self._extres_cache[unity_path] = f'ExtResource("{godot_path}")'
+        return ref
+
     def convert_mesh_filter(self, component, node):
         mesh_path = component.get('Mesh', {}).get('Path')
         if mesh_path:
-            godot_mesh_path = self.asset_map.get(mesh_path)
-            if godot_mesh_path:
-                node.add_property("mesh", Property("ExtResource", f'ExtResource("{godot_mesh_path}")'))
+            mesh_ref = self._ext_resource(mesh_path)
+            if mesh_ref:
+                node.add_property("mesh", self._P['ExtResource'](mesh_ref))
 
     def convert_mesh_renderer(self, component, node):
         materials = component.get('Materials', [])
         for i, material in enumerate(materials):
             material_path = material.get('Path')
             if material_path:
-                godot_material_path = self.asset_map.get(material_path)
-                if godot_material_path:
-                    node.add_property(f"material_{i}", Property("ExtResource", f'ExtResource("{godot_material_path}")'))
+                material_ref = self._ext_resource(material_path)
+                if material_ref:
+                    node.add_property(f"material_{i}", self._P['ExtResource'](material_ref))
 
     def convert_camera(self, component, node):
-        node.add_property("fov", Property("float", str(component.get('FieldOfView', 60))))
-        node.add_property("near", Property("float", str(component.get('NearClipPlane', 0.3))))
-        node.add_property("far", Property("float", str(component.get('FarClipPlane', 1000))))
+        node.add_property("fov", self._P['float'](str(component.get('FieldOfView', 60))))
+        node.add_property("near", self._P['float'](str(component.get('NearClipPlane', 0.3))))
+        node.add_property("far", self._P['float'](str(component.get('FarClipPlane', 1000))))
 
     def convert_light(self, component, node):
         light_type = component.get('Type', 'Point')
@@ -322,24 +617,24 @@ class UnityToGodotConverter:
             node.type = "OmniLight3D"
 
         color = component.get('Color', {'r': 1, 'g': 1, 'b': 1, 'a': 1})
-        node.add_property("light_color", Property("Color", f"Color({color['r']}, {color['g']}, {color['b']}, {color['a']})"))
-        node.add_property("light_energy", Property("float", str(component.get('Intensity', 1))))
+        node.add_property("light_color", self._P['Color'](_COLOR_FMT.format_map(color)))
+        node.add_property("light_energy", self._P['float'](str(component.get('Intensity', 1))))
 
     def convert_rigidbody(self, component, node):
-        node.add_property("mass", Property("float", str(component.get('Mass', 1))))
-        node.add_property("gravity_scale", Property("float", "1.0" if component.get('UseGravity', True) else "0.0"))
+        node.add_property("mass", self._P['float'](str(component.get('Mass', 1))))
+        node.add_property("gravity_scale", self._P['float']("1.0" if component.get('UseGravity', True) else "0.0"))
         if component.get('IsKinematic', False):
             node.type = "AnimatableBody3D"
 
     def convert_collider(self, component, node):
-        collider_node = Node("CollisionShape3D", name="Collider")
+        collider_node = self._new_node("CollisionShape3D", "Collider")
         node.add_child(collider_node)
 
         shape_type = component['Type']
         if shape_type == "BoxCollider":
             shape = "BoxShape3D"
             size = component.get('Size', {'x': 1, 'y': 1, 'z': 1})
-            shape_params = f"size = Vector3({size['x']}, {size['y']}, {size['z']})"
+            shape_params = "size = " + _VECTOR3_FMT.format_map(size)
         elif shape_type == "SphereCollider":
             shape = "SphereShape3D"
             radius = component.get('Radius', 0.5)
@@ -350,52 +645,47 @@ class UnityToGodotConverter:
             height = component.get('Height', 2)
             shape_params = f"radius = {radius}, height = {height}"
 
-        collider_node.add_property("shape", Property("Shape3D", f"{shape}.new({shape_params})"))
+        collider_node.add_property("shape", self._property("Shape3D", f"{shape}.new({shape_params})"))
 
     def convert_particle_system(self, component, node):
-        node.add_property("amount", Property("int", str(component.get('MaxParticles', 1000))))
-        node.add_property("lifetime", Property("float", str(component.get('StartLifetime', 5))))
-        node.add_property("explosiveness", Property("float", "0.0"))
-        node.add_property("randomness", Property("float", "0.0"))
+        node.add_property("amount", self._property("int", str(component.get('MaxParticles', 1000))))
+        node.add_property("lifetime", self._P['float'](str(component.get('StartLifetime', 5))))
+        node.add_property("explosiveness", self._P['float']("0.0"))
+        node.add_property("randomness", self._P['float']("0.0"))
 
         # TODO: Convert more particle system properties
 
     def convert_canvas(self, component, node):
-        node.add_property("layer", Property("int", str(component.get('RenderMode', 0))))
+        node.add_property("layer", self._property("int", str(component.get('RenderMode', 0))))
         
         scaler = component.get('CanvasScaler', {})
         if scaler:
-            node.add_property("scale_mode", Property("int", str(scaler.get('ScaleMode', 0))))
+            node.add_property("scale_mode", self._property("int", str(scaler.get('ScaleMode', 0))))
             ref_res = scaler.get('ReferenceResolution', {'x': 800, 'y': 600})
-            node.add_property("reference_resolution", Property("Vector2", f"Vector2({ref_res['x']}, {ref_res['y']})"))
+            node.add_property("reference_resolution", self._property("Vector2", _VECTOR2_FMT.format_map(ref_res)))
 
     def convert_rect_transform(self, component, node):
         anchors = component.get('Anchors', {'min': {'x': 0, 'y': 0}, 'max': {'x': 1, 'y': 1}})
-        node.add_property("anchor_left", Property("float", str(anchors['min']['x'])))
-        node.add_property("anchor_top", Property("float", str(anchors['min']['y'])))
-        node.add_property("anchor_right", Property("float", str(anchors['max']['x'])))
-        node.add_property("anchor_bottom", Property("float", str(anchors['max']['y'])))
+        node.add_property("anchor_left", self._P['float'](str(anchors['min']['x'])))
+        node.add_property("anchor_top", self._P['float'](str(anchors['min']['y'])))
+        node.add_property("anchor_right", self._P['float'](str(anchors['max']['x'])))
+        node.add_property("anchor_bottom", self._P['float'](str(anchors['max']['y'])))
 
         # TODO: Convert more RectTransform properties
 
     def convert_script_component(self, component, node):
         script_path = component.get('Script', {}).get('Path')
         if script_path:
-            godot_script_path = self.asset_map.get(script_path)
-            if godot_script_path:
-                node.add_property("script", Property("ExtResource", f'ExtResource("{godot_script_path}")'))
+            script_ref = self._ext_resource(script_path)
+            if script_ref:
+                node.add_property("script", self._P['ExtResource'](script_ref))
 
     def convert_prefabs(self):
         for prefab_name, prefab_path in self.prefabs.items():
             godot_scene_path = os.path.join(self.godot_project_path, "prefabs", f"{prefab_name}.tscn")
-            os.makedirs(os.path.dirname(godot_scene_path), exist_ok=True)
-            
-            with open(prefab_path, 'r') as f:
-                prefab_data = yaml.safe_load(f)
+            prefab_data = _load_yaml(prefab_path, self.yaml_cache_dir)
             
-            godot_scene = GDScene()
-            root_node = Node("Node3D", name=prefab_name)
-            godot_scene.add_node(root_node)
+            godot_scene, root_node = self._new_scene("Node3D", prefab_name)
             
             self.convert_game_object(prefab_data, root_node)
             
@@ -404,29 +694,44 @@ class UnityToGodotConverter:
             self.asset_map[prefab_path] = godot_scene_path
 
     def update_asset_references(self):
-        for root, _, files in os.walk(self.godot_project_path):
-            for file in files:
-                if file.endswith(".tscn") or file.endswith(".tres"):
-                    file_path = os.path.join(root, file)
-                    self.update_file_references(file_path)
-
-    def update_file_references(self, file_path):
-        with open(file_path, 'r') as f:
+        replacements = {os.path.basename(u): os.path.basename(g) for u, g in self.asset_map.items()}
+        if not replacements:
+            return
+        # Longest names first so a filename never shadows a longer one it prefixes.
+        pattern = re.compile('|'.join(re.escape(name) for name in sorted(replacements, key=len, reverse=True)))
+
+        # Every scene/resource we wrote is recorded in asset_map, so there is
+        # no need to walk the Godot project again to find them.
+        for godot_path in self.asset_map.values():
+            if godot_path.endswith((".tscn", ".tres")):
+                self.update_file_references(godot_path, pattern, replacements)
+
+    def update_file_references(self, file_path, pattern, replacements):
+        with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        for unity_path, godot_path in self.asset_map.items():
-            unity_filename = os.path.basename(unity_path)
-            godot_filename = os.path.basename(godot_path)
-            content = content.replace(unity_filename, godot_filename)
+        content = pattern.sub(lambda m: replacements[m.group(0)], content)
 
-        with open(file_path, 'w') as f:
-            f.write(content)
+        _write_bytes(file_path, content.encode('utf-8'))
 
     def run(self):
         print("Starting Unity to Godot conversion...")
         self.convert_project()
         print("Conversion complete!")
 
+_worker_converter = None
+
+
+def _init_worker(unity_project_path, godot_project_path, use_gdscene, asset_map):
+    global _worker_converter
+    _worker_converter = UnityToGodotConverter(unity_project_path, godot_project_path, use_gdscene)
+    _worker_converter.asset_map.update(asset_map)
+
+
+def _run_worker_task(method_name, args):
+    return getattr(_worker_converter, method_name)(*args)
+
+
 if __name__ == "__main__":
     unity_project_path = input("Enter the path to your Unity project: ")
     godot_project_path = input("Enter the path for the new Godot project: ")